@@ -0,0 +1,30 @@
+"""
+PDF Files - Directory walking shared by the resume extractor and the dashboard.
+
+License: MIT License
+Copyright (c) 2024 Scott White
+See LICENSE file for full license text.
+"""
+
+import logging
+import os
+
+def walk_pdfs(root, skip_hidden=False):
+    """Yield the path of every PDF under root using a single os.scandir traversal.
+
+    Directories that cannot be read are logged and skipped, as Path.rglob does.
+    skip_hidden also leaves out dot entries such as .git.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError as e:
+        logging.warning(f"Could not scan {root}: {e}")
+        return
+    for entry in entries:
+        if skip_hidden and entry.name.startswith('.'):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_pdfs(entry.path, skip_hidden)
+        elif entry.name.endswith('.pdf'):
+            yield entry.path
@@ -11,29 +11,379 @@ Copyright (c) 2024 Scott White
 See LICENSE file for full license text.
 """
 
+import io
 import os
 import re
 import csv
+import json
 import time
+import queue
+import string
+import hashlib
 import logging
 import sys
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 import threading
 import fitz  # PyMuPDF
+import httpx
+import tiktoken
 import PyPDF2
+import pypdfium2 as pdfium
 from pydantic import BaseModel, Field
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 import instructor
+import groq
 from groq import Groq
+import openai
 from openai import OpenAI
 import anthropic
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from tqdm import tqdm
 
+from pdf_files import walk_pdfs
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Approximate size of a ResumeData JSON response, used for token budgeting
+EXPECTED_OUTPUT_TOKENS = 1500
+
+# Context window sizes for the tested models; unknown models get a conservative default
+MODEL_CONTEXT_TOKENS = {
+    "llama-3.3-70b-versatile": 131072,
+    "gpt-4": 8192,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "claude-3-5-haiku-20241022": 200000,
+    "gemini-2.0-flash-exp": 1048576,
+}
+DEFAULT_CONTEXT_TOKENS = 8192
+
+# Maximum response tokens per request for the same models; a batch of N resumes needs
+# N * EXPECTED_OUTPUT_TOKENS of it, so this caps how many resumes share a request
+MODEL_OUTPUT_TOKENS = {
+    "llama-3.3-70b-versatile": 32768,
+    "gpt-4": 8192,
+    "gpt-4o": 16384,
+    "gpt-4o-mini": 16384,
+    "claude-3-5-haiku-20241022": 8192,
+    "gemini-2.0-flash-exp": 8192,
+}
+DEFAULT_OUTPUT_TOKENS = 4096
+
+# Headroom for the filename line, message framing and tokenizer differences between providers
+CONTEXT_SAFETY_TOKENS = 256
+
+# Resume text tokens sent per request; a resume rarely needs more, and every extra
+# prompt token adds cost and latency
+RESUME_TEXT_TOKENS = 4096
+
+# Trailing sections that carry nothing the rubric scores; the heading and everything after it is dropped
+TRAILING_SECTION_RE = re.compile(r'^[ \t]*(?:references|hobbies(?: (?:and|&) interests)?)[ \t]*:?[ \t]*$.*',
+                                 re.I | re.M | re.S)
+# Such a heading only counts in the second half of the text; earlier it is a sidebar, not a trailing section
+TRAILING_SECTION_START = 0.5
+# Profile link lines appended by extract_text_from_pdf, kept even when their page ends in a dropped section
+LINK_LINE_RE = re.compile(r'^(?:GitHub|LinkedIn|Link): \S+$', re.M)
+BLANK_LINES_RE = re.compile(r'\n[ \t]*(?:\n[ \t]*)+')
+
+# Seconds between status checks of an OpenAI Batch API job
+BATCH_API_POLL_SECONDS = 30
+
+# Edits to the prompts or the ResumeData schema invalidate cached LLM responses on their own
+# (see PROMPT_FINGERPRINT); bump this to discard them for any other reason
+PROMPT_VERSION = 4
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'resume_extractor')
+
+# Column order of the results CSV (the dashboard reads these names)
+RESUME_FIELDNAMES: Tuple[str, ...] = (
+    'resume_filename', 'candidate_name', 'email', 'github_link', 'linkedin_link', 
+    'country', 'city', 'estimated_job_level', 'programming_experience_years', 'ai_experience_years',
+    'college_education_years', 'highest_degree', 'bachelors_university', 'graduate_university',
+    'university_tier', 'overall_world_ranking', 'cs_world_ranking', 'bachelors_gpa', 'masters_gpa',
+    'companies_worked', 'company_tier', 
+    'javascript_skill_level', 'python_skill_level', 'cloud_skill_level', 'llm_skill_level',
+    'cs_internships', 'cloud_experience_years', 'llm_experience_years',
+    # Frontend Stack
+    'react_strength', 'typescript_strength', 'nextjs_strength', 'api_design_strength',
+    'tailwind_strength', 'git_strength', 'agile_strength',
+    'aws_services_experience', 'database_technologies', 'ai_tools_experience', 'llm_api_experience',
+    # Work style
+    'startup_experience_strength', 'open_source_strength', 'leadership_strength', 'autonomy_indicators',
+    # CS fundamentals
+    'algorithms_strength', 'system_design_strength',
+    # Age-Relative Aggregate Scores
+    'academic_strength', 'cs_strength', 'industry_strength', 'fullstack_strength',
+    'opensource_strength', 'accomplishments_strength', 'overall_score',
+    # Accomplishments
+    'accomplishment_1', 'accomplishment_2', 'accomplishment_3',
+)
+
+class RateLimiter:
+    """Thread-safe token bucket enforcing requests-per-minute and tokens-per-minute limits.
+
+    Capacity refills continuously, so workers only wait when the provider budget
+    is actually exhausted rather than being spaced out by a fixed delay.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_request_capacity = requests_per_minute
+        self.available_token_capacity = tokens_per_minute or 0
+        self.last_update_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.last_update_time = now
+        self.available_request_capacity = min(
+            self.requests_per_minute,
+            self.available_request_capacity + self.requests_per_minute * elapsed / 60.0
+        )
+        if self.tokens_per_minute:
+            self.available_token_capacity = min(
+                self.tokens_per_minute,
+                self.available_token_capacity + self.tokens_per_minute * elapsed / 60.0
+            )
+
+    def acquire(self, tokens: int = 0):
+        """Block until capacity for one request of `tokens` tokens is available, then consume it."""
+        if self.tokens_per_minute:
+            # A single request larger than the bucket would otherwise wait forever
+            tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            with self._lock:
+                self._refill()
+                enough_tokens = not self.tokens_per_minute or self.available_token_capacity >= tokens
+                if self.available_request_capacity >= 1 and enough_tokens:
+                    self.available_request_capacity -= 1
+                    if self.tokens_per_minute:
+                        self.available_token_capacity -= tokens
+                    return
+                wait_time = (1 - self.available_request_capacity) * 60.0 / self.requests_per_minute
+                if not enough_tokens:
+                    token_wait = (tokens - self.available_token_capacity) * 60.0 / self.tokens_per_minute
+                    wait_time = max(wait_time, token_wait)
+            time.sleep(max(wait_time, 0.01))
+
+class DynamicTokenBatcher:
+    """Packs resumes into multi-resume requests that fit the model's context window.
+
+    Each resume costs its input tokens, capped at max_text_tokens like the text sent,
+    plus EXPECTED_OUTPUT_TOKENS for its share of the response; a batch is closed when the next resume would exceed the budget
+    or the batch already holds max_batch_size resumes.
+    """
+
+    # Separator and header lines added around each resume in a batched prompt
+    PER_RESUME_OVERHEAD_TOKENS = 20
+
+    def __init__(self, encoding, max_batch_tokens: int, max_batch_size: int, max_text_tokens: int):
+        self.encoding = encoding
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_text_tokens = max_text_tokens
+
+    def cost(self, text: str) -> int:
+        text_tokens = min(len(self.encoding.encode(text)), self.max_text_tokens)
+        return text_tokens + self.PER_RESUME_OVERHEAD_TOKENS + EXPECTED_OUTPUT_TOKENS
+
+    def pack(self, items: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        """Split (key, text) items into batches, preserving order."""
+        batches = []
+        batch, batch_tokens = [], 0
+        for item in items:
+            item_tokens = self.cost(item[1])
+            if batch and (len(batch) >= self.max_batch_size or batch_tokens + item_tokens > self.max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(item)
+            batch_tokens += item_tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+class ResumeCache:
+    """Content-addressed on-disk cache of extracted PDF text and parsed resume data.
+
+    Text is keyed by the BLAKE2b hash of the PDF bytes; parsed results are keyed by the
+    extracted text together with provider, model, PROMPT_VERSION and PROMPT_FINGERPRINT,
+    so re-exported PDFs with identical text also skip the LLM. Entries are written atomically so
+    an interrupted run never leaves a truncated file behind.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.text_dir = os.path.join(cache_dir, 'text')
+        self.results_dir = os.path.join(cache_dir, 'results')
+        os.makedirs(self.text_dir, exist_ok=True)
+        os.makedirs(self.results_dir, exist_ok=True)
+
+    @staticmethod
+    def _write_atomic(path: str, content: str):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def result_key(text: str, provider: str, model: str) -> str:
+        return hashlib.sha256(f"{provider}|{model}|{PROMPT_VERSION}|{PROMPT_FINGERPRINT}|{text}".encode()).hexdigest()
+
+    def get_text(self, content_hash: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.text_dir, f"{content_hash}.txt"), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put_text(self, content_hash: str, text: str):
+        self._write_atomic(os.path.join(self.text_dir, f"{content_hash}.txt"), text)
+
+    def get_result(self, key: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(self.results_dir, f"{key}.json"), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put_result(self, key: str, resume_data: BaseModel):
+        self._write_atomic(os.path.join(self.results_dir, f"{key}.json"), resume_data.model_dump_json())
+
+# Transient provider errors that are worth retrying with backoff
+RETRYABLE_API_ERRORS = (
+    groq.RateLimitError, groq.InternalServerError, groq.APIConnectionError,
+    openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError,
+    anthropic.RateLimitError, anthropic.InternalServerError, anthropic.APIConnectionError,
+    google_exceptions.ResourceExhausted, google_exceptions.InternalServerError, google_exceptions.ServiceUnavailable,
+)
+
+# Malformed tool calls that the provider rejects before instructor sees a response
+PROVIDER_TOOL_ERROR_RE = re.compile(r'tool call validation failed|Failed to call a function')
+
+def _is_retryable_api_error(exc: BaseException) -> bool:
+    """Check an exception, or the provider error instructor wrapped it around, for a transient failure.
+
+    Tool calls the provider itself rejects as malformed (Groq validates them server side)
+    never reach instructor's validation reask, so they are retried as a fresh request.
+    """
+    if isinstance(exc, RETRYABLE_API_ERRORS) or isinstance(exc.__cause__, RETRYABLE_API_ERRORS):
+        return True
+    return PROVIDER_TOOL_ERROR_RE.search(str(exc)) is not None
+
+def _log_api_retry(retry_state):
+    error_str = str(retry_state.outcome.exception())
+    logging.warning(f"Transient LLM error, waiting {retry_state.next_action.sleep:.1f}s before retry "
+                    f"({retry_state.attempt_number}/5): {error_str[:100]}")
+
+# Labels for profile links found in PDFs; anything else is a plain "Link"
+LINK_RE = re.compile(r'(github|linkedin)', re.I)
+LINK_LABELS = {'github': 'GitHub', 'linkedin': 'LinkedIn'}
+
+def _link_line(uri: str) -> str:
+    match = LINK_RE.search(uri)
+    label = LINK_LABELS[match.group(1).lower()] if match else 'Link'
+    return f"\n{label}: {uri}"
+
+class _ApproximateEncoding:
+    """Stand-in for a tiktoken encoding that assumes ~4 characters per token."""
+
+    def encode(self, text: str) -> List[str]:
+        return [text[i:i + 4] for i in range(0, len(text), 4)]
+
+    def decode(self, tokens: List[str]) -> str:
+        return "".join(tokens)
+
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model, falling back to cl100k_base for non-OpenAI models.
+
+    tiktoken downloads its BPE tables on first use, so an approximate encoding is
+    used when they cannot be fetched (e.g. offline machines).
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logging.warning(f"Could not load tiktoken encoding ({e}), using approximate token counts")
+        return _ApproximateEncoding()
+
+# Per-resume user message; the static instructions live in SYSTEM_PROMPT
+USER_PROMPT_SRC = "FILENAME: ${filename}\n\nRESUME TEXT:\n${resume_text}"
+BATCH_ENTRY_SRC = "---\nINDEX ${index} FILENAME: ${filename}\nRESUME TEXT:\n${resume_text}"
+
+# Static extraction instructions shared by every request. Keeping this identical
+# across calls lets providers with prompt caching reuse the prefix.
+SYSTEM_PROMPT = """Analyze the resume in the user message and extract the following information. Be precise and realistic in your assessments.
+
+IMPORTANT:
+- Set resume_filename to the FILENAME given in the user message
+- ALL field names must match EXACTLY (no extra spaces or typos)
+- ALL required fields must be present - do not skip any fields
+- Use empty string "" for missing links, not null
+- Return VALID JSON only - no extra text, tags, or formatting
+- Do not add [/function] or any closing tags
+
+Skill scale (used by every 1-5 field unless stated otherwise): 1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert
+Tier scale (universities and companies): 1=best ... 5=unknown/below average
+
+1. Basic Information:
+   - Full name (if not clear from text, extract from filename) - avoid special characters like apostrophes
+   - Email address; GitHub and LinkedIn URLs ("" if not found); country and city
+   - Estimated job level based on experience and skills:
+     Intern: student/recent grad, internships only | L3/AMTS: 0-2 yrs, entry level | L4/MTS: 2-4 yrs, mid-level IC
+     L5/SMTS: 4-7 yrs, senior IC | L6/LMTS: 7-10 yrs, tech lead | L7/PMTS: 10+ yrs, principal/architect
+     L8/Architect: 12+ yrs, distinguished engineer
+
+2. Experience in decimal years (e.g. 2.5; 0 if none): professional programming (excluding education), AI/ML, cloud (AWS/Azure/GCP), LLM/NLP
+
+3. Education:
+   - Total years of college education (4 for bachelors, 6 for masters, 8+ for PhD) and highest degree
+   - Bachelor's university (full name); graduate university (Masters/PhD, "" if none)
+   - University tier for CS program (best university attended): 1=top (MIT, Stanford, CMU, Berkeley), 2=excellent (Purdue, UCLA, UCSD, Georgia Tech), 3=good (state/well-known regional), 4=average, 5=below average/unknown
+   - Overall world ranking of best university (1-2000+, 0 if unknown). Examples: Harvard=1, MIT=2, Stanford=3, Berkeley=14, Purdue=126, Arizona State=1100, Western Michigan=1200
+   - CS world ranking of best university (1-500+, 0 if unknown). Examples: MIT=1, Stanford=2, Berkeley=3, Purdue=20, Arizona State=85, Western Michigan=200+
+   - Bachelor's and Master's GPA (0.0-4.0, 0.0 if not mentioned or no such degree)
+
+4. Work Experience:
+   - ALL companies worked at, most recent first (comma-separated)
+   - Company tier of most impressive employer: 1=FAANG/top tech (Google, Meta, Amazon, Microsoft, Apple, OpenAI), 2=well-known tech/unicorn (Uber, Airbnb, Stripe), 3=established non-tech/consulting, 4=startup/smaller company, 5=unknown/none
+   - Number of CS-related internships
+
+5. Skill Levels (skill scale):
+   - JavaScript/TypeScript and Python: 2=tutorials/simple projects, 3=used professionally, 4=complex projects/mentors others, 5=thought leader/OSS contributor/architect
+   - Cloud (AWS/Azure/GCP): 2=used some services, 3=deployed apps, 4=designed architectures/cost/security, 5=certified/large-scale/IaC
+   - LLM/NLP: 2=used APIs/simple prompts, 3=fine-tuning/RAG/prompt engineering, 4=production systems/model optimization, 5=research/custom models/papers
+   - React, TypeScript, Next.js, REST API design, Tailwind CSS, Git/GitHub, Agile/Scrum
+   - Also list: AWS services used, database technologies, AI developer tools (Cursor, Claude Code, Copilot), LLM APIs (OpenAI, Anthropic, Gemini)
+
+6. Work Style (skill scale): startup experience (5=founder/early employee), open source (5=maintainer), leadership (5=managed teams); evidence of autonomous work (freelance, solo projects)
+
+7. CS Fundamentals (skill scale): algorithms/data structures (education, competitions, projects), system design (5=designed large systems)
+
+8. EXPERIENCE-RELATIVE AGGREGATE SCORES (1-10, ALL RELATIVE TO JOB LEVEL):
+   Score against what would be exceptional for someone at their level - compare an L3/AMTS to other L3/AMTS engineers, not to L7/PMTS.
+   Bands: 10=exceptional for level, 8-9=strong, 6-7=solid, 4-5=basic, 1-3=weak
+   - Academic: world/CS ranking, GPA, degrees, research. 10=top 5 world universities with high GPA, 8-9=top 50, 6-7=top 200 or strong GPA at lower-ranked school, 4-5=top 500-1000, 1-3=1000+ or poor performance. Weight CS ranking more than overall ranking.
+   - CS: algorithms, data structures, system design, competitions (10=international competition winner)
+   - Industry: quality of companies and roles (10=FAANG/top tech, exceptional roles)
+   - Full-Stack: frontend + backend + cloud (10=production-level full-stack expertise)
+   - Open Source: GitHub contributions and projects (10=major contributor/maintainer, 1-3=no presence)
+   - Accomplishments: awards, publications, impact (10=founded company, published papers, major awards)
+   - Overall Score: average of the above 6 scores (round to 1 decimal)
+
+9. Accomplishments: up to three, most impressive first, favoring quantifiable impact, awards, publications and leadership roles.
+
+Be accurate and conservative in your estimates. If information is not clear, make reasonable inferences based on the context."""
+
 """
 Pydantic model for structured resume data extraction.
 
@@ -64,23 +414,23 @@ class ResumeData(BaseModel):
     
     # ==================== EDUCATION INFORMATION ====================
     # Customize university tier definitions and ranking systems as needed
-    college_education_years: int = Field(description="Total years of college education (4 for bachelors, 6 for masters, 8+ for PhD)")
+    college_education_years: int = Field(ge=0, description="Total years of college education (4 for bachelors, 6 for masters, 8+ for PhD)")
     highest_degree: str = Field(description="Highest degree obtained (e.g., Bachelors, Masters, PhD)")
     bachelors_university: str = Field(description="University attended for bachelor's degree")
     graduate_university: str = Field(description="University attended for graduate degree (Masters/PhD), empty if none")
-    university_tier: int = Field(description="University tier for CS program (1=top tier like MIT/Stanford, 2=excellent like Purdue, 3=good, 4=average, 5=below average)")
-    overall_world_ranking: int = Field(description="Overall world ranking of best university attended (1-2000+, 0 if unknown)")
-    cs_world_ranking: int = Field(description="CS program world ranking of best university attended (1-500+, 0 if unknown)")
-    bachelors_gpa: float = Field(description="GPA for bachelor's degree (0.0-4.0 scale, 0.0 if not mentioned)")
-    masters_gpa: float = Field(description="GPA for master's degree (0.0-4.0 scale, 0.0 if not mentioned or no masters)")
+    university_tier: int = Field(ge=1, le=5, description="University tier for CS program (1=top tier like MIT/Stanford, 2=excellent like Purdue, 3=good, 4=average, 5=below average)")
+    overall_world_ranking: int = Field(ge=0, description="Overall world ranking of best university attended (1-2000+, 0 if unknown)")
+    cs_world_ranking: int = Field(ge=0, description="CS program world ranking of best university attended (1-500+, 0 if unknown)")
+    bachelors_gpa: float = Field(ge=0.0, le=4.0, description="GPA for bachelor's degree (0.0-4.0 scale, 0.0 if not mentioned)")
+    masters_gpa: float = Field(ge=0.0, le=4.0, description="GPA for master's degree (0.0-4.0 scale, 0.0 if not mentioned or no masters)")
     
     # ==================== WORK EXPERIENCE ====================
     # Customize company tier definitions and job level categories
     estimated_job_level: str = Field(description="Estimated job level (Intern, L3/AMTS, L4/MTS, L5/SMTS, L6/LMTS, L7/PMTS, L8/Architect based on experience and skills)")
-    programming_experience_years: float = Field(description="Total years of programming/software development experience in industry")
+    programming_experience_years: float = Field(ge=0, description="Total years of programming/software development experience in industry")
     companies_worked: str = Field(description="List of companies worked at, ordered by recency, comma-separated")
-    company_tier: int = Field(description="Tier of most impressive work experience (1=FAANG/top tech, 2=unicorn/well-known, 3=established company, 4=startup, 5=unknown)")
-    cs_internships: int = Field(description="Number of CS-related internships")
+    company_tier: int = Field(ge=1, le=5, description="Tier of most impressive work experience (1=FAANG/top tech, 2=unicorn/well-known, 3=established company, 4=startup, 5=unknown)")
+    cs_internships: int = Field(ge=0, description="Number of CS-related internships")
     
     # ==================== CUSTOMIZABLE SKILL ASSESSMENT ====================
     # 🎯 CUSTOMIZE THIS SECTION FOR YOUR SPECIFIC REQUIREMENTS
@@ -90,64 +440,287 @@ class ResumeData(BaseModel):
     # - Add/remove programming languages
     # - Change frameworks and tools
     # - Adjust skill categories
-    # - Modify the 1-5 scale if needed
+    # - Modify the 1-5 scale if needed (keep the ge/le bounds in step)
     
     # Core Programming Languages (customize list)
-    javascript_skill_level: int = Field(description="JavaScript/TypeScript skill level (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    python_skill_level: int = Field(description="Python skill level (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
+    javascript_skill_level: int = Field(ge=1, le=5, description="JavaScript/TypeScript skill level (1-5 skill scale)")
+    python_skill_level: int = Field(ge=1, le=5, description="Python skill level (1-5 skill scale)")
     
     # Frontend Technologies (add/remove as needed)
-    react_strength: int = Field(description="React.js expertise level (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    typescript_strength: int = Field(description="TypeScript expertise level (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    nextjs_strength: int = Field(description="Next.js expertise level (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    tailwind_strength: int = Field(description="Tailwind CSS expertise (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
+    react_strength: int = Field(ge=1, le=5, description="React.js expertise level (1-5 skill scale)")
+    typescript_strength: int = Field(ge=1, le=5, description="TypeScript expertise level (1-5 skill scale)")
+    nextjs_strength: int = Field(ge=1, le=5, description="Next.js expertise level (1-5 skill scale)")
+    tailwind_strength: int = Field(ge=1, le=5, description="Tailwind CSS expertise (1-5 skill scale)")
     
     # Backend & Infrastructure (customize for your stack)
-    api_design_strength: int = Field(description="REST API design expertise (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    cloud_skill_level: int = Field(description="Cloud infrastructure skill level (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    cloud_experience_years: float = Field(description="Years of cloud experience (AWS, Azure, GCP)")
+    api_design_strength: int = Field(ge=1, le=5, description="REST API design expertise (1-5 skill scale)")
+    cloud_skill_level: int = Field(ge=1, le=5, description="Cloud infrastructure skill level (1-5 skill scale)")
+    cloud_experience_years: float = Field(ge=0, description="Years of cloud experience (AWS, Azure, GCP)")
     aws_services_experience: str = Field(description="AWS services used (Lambda, S3, API Gateway, etc.)")
     database_technologies: str = Field(description="Database technologies used (PostgreSQL, MongoDB, DynamoDB, etc.)")
     
     # AI/ML Specialization (remove if not relevant)
-    ai_experience_years: float = Field(description="Years of AI/ML experience")
-    llm_skill_level: int = Field(description="LLM/NLP skill level (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    llm_experience_years: float = Field(description="Years of LLM/NLP experience")
+    ai_experience_years: float = Field(ge=0, description="Years of AI/ML experience")
+    llm_skill_level: int = Field(ge=1, le=5, description="LLM/NLP skill level (1-5 skill scale)")
+    llm_experience_years: float = Field(ge=0, description="Years of LLM/NLP experience")
     ai_tools_experience: str = Field(description="AI developer tools used (Cursor, Claude Code, Copilot, etc.)")
     llm_api_experience: str = Field(description="LLM APIs used (OpenAI, Anthropic, Gemini, etc.)")
     
     # Development Practices (adjust based on your workflow)
-    git_strength: int = Field(description="Git/GitHub expertise (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
-    agile_strength: int = Field(description="Agile/Scrum expertise (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
+    git_strength: int = Field(ge=1, le=5, description="Git/GitHub expertise (1-5 skill scale)")
+    agile_strength: int = Field(ge=1, le=5, description="Agile/Scrum expertise (1-5 skill scale)")
     
     # CS Fundamentals (typically kept for technical roles)
-    algorithms_strength: int = Field(description="Algorithm/data structure strength (1-5 based on projects, education, competitions)")
-    system_design_strength: int = Field(description="System design/architecture expertise (1=none, 2=basic, 3=intermediate, 4=advanced, 5=expert)")
+    algorithms_strength: int = Field(ge=1, le=5, description="Algorithm/data structure strength (1-5 based on projects, education, competitions)")
+    system_design_strength: int = Field(ge=1, le=5, description="System design/architecture expertise (1-5 skill scale)")
     
     # Work Style & Leadership (adjust based on role level)
-    startup_experience_strength: int = Field(description="Startup experience level (1=none, 2=minimal, 3=some, 4=significant, 5=extensive)")
-    open_source_strength: int = Field(description="Open source contribution level (1=none, 2=minimal, 3=some, 4=active, 5=maintainer)")
-    leadership_strength: int = Field(description="Leadership experience level (1=none, 2=minimal, 3=some lead, 4=team lead, 5=manager)")
+    startup_experience_strength: int = Field(ge=1, le=5, description="Startup experience level (1=none, 2=minimal, 3=some, 4=significant, 5=extensive)")
+    open_source_strength: int = Field(ge=1, le=5, description="Open source contribution level (1=none, 2=minimal, 3=some, 4=active, 5=maintainer)")
+    leadership_strength: int = Field(ge=1, le=5, description="Leadership experience level (1=none, 2=minimal, 3=some lead, 4=team lead, 5=manager)")
     autonomy_indicators: str = Field(description="Evidence of autonomous work (freelance, solo projects, etc.)")
     
     # ==================== AGGREGATE SCORING ====================
     # These aggregate scores are calculated relative to experience level
     # Modify the categories below to match your skill assessment above
-    academic_strength: int = Field(description="Academic strength relative to experience level (1-10, where 10=exceptional education for their career level)")
-    cs_strength: int = Field(description="CS fundamentals strength relative to experience level (1-10, algorithms, system design, competitions)")
-    industry_strength: int = Field(description="Industry experience strength relative to experience level (1-10, quality of companies and roles)")
-    fullstack_strength: int = Field(description="Full-stack development strength relative to experience level (1-10, frontend + backend + cloud)")
-    opensource_strength: int = Field(description="Open source contribution strength relative to experience level (1-10, contributions and impact)")
-    accomplishments_strength: int = Field(description="Accomplishments strength relative to experience level (1-10, awards, publications, impact)")
-    overall_score: float = Field(description="Average of all 6 strength scores")
+    academic_strength: int = Field(ge=1, le=10, description="Academic strength relative to experience level (1-10, where 10=exceptional education for their career level)")
+    cs_strength: int = Field(ge=1, le=10, description="CS fundamentals strength relative to experience level (1-10, algorithms, system design, competitions)")
+    industry_strength: int = Field(ge=1, le=10, description="Industry experience strength relative to experience level (1-10, quality of companies and roles)")
+    fullstack_strength: int = Field(ge=1, le=10, description="Full-stack development strength relative to experience level (1-10, frontend + backend + cloud)")
+    opensource_strength: int = Field(ge=1, le=10, description="Open source contribution strength relative to experience level (1-10, contributions and impact)")
+    accomplishments_strength: int = Field(ge=1, le=10, description="Accomplishments strength relative to experience level (1-10, awards, publications, impact)")
+    overall_score: float = Field(ge=1, le=10, description="Average of all 6 strength scores")
     
     # ==================== ACCOMPLISHMENTS ====================
-    accomplishment_1: str = Field(description="Most impressive accomplishment")
-    accomplishment_2: str = Field(description="Second most impressive accomplishment")
-    accomplishment_3: str = Field(description="Third most impressive accomplishment")
+    # A single list keeps the schema and response shorter than three separate keys;
+    # it is flattened back to accomplishment_1..3 columns when the CSV is written
+    accomplishments: List[str] = Field(max_length=3, description="Up to three most impressive accomplishments, most impressive first")
+
+class BatchedResumeData(ResumeData):
+    """One resume of a batched response, tagged with the INDEX it was given under."""
+    index: int = Field(description="INDEX of the resume this entry describes, exactly as given in the user message")
+
+class ResumeBatch(BaseModel):
+    """Response model when several resumes are parsed in one request."""
+    resumes: List[BatchedResumeData] = Field(description="One entry per resume, in the order the resumes were given")
+
+# Hash of everything that shapes a parsed result, so cached results are not reused after
+# the prompts or the schema are edited
+PROMPT_FINGERPRINT = hashlib.sha256("\0".join([
+    SYSTEM_PROMPT, USER_PROMPT_SRC, json.dumps(ResumeData.model_json_schema(), sort_keys=True),
+]).encode()).hexdigest()
+
+def _csv_row(row: Dict) -> Dict:
+    """Flatten the accomplishments list into the accomplishment_1..3 CSV columns."""
+    if 'accomplishments' not in row:
+        return row  # already flat, e.g. loaded from an earlier CSV
+    row = dict(row)
+    accomplishments = row.pop('accomplishments') or []
+    for i in range(3):
+        row[f'accomplishment_{i + 1}'] = accomplishments[i] if i < len(accomplishments) else ''
+    return row
+
+def _with_duplicates(outcomes: List[Tuple[str, Optional[Dict], Optional[str]]], duplicates: Dict[str, List[str]]):
+    """Yield each (path, result, error) outcome followed by a copy for every identical file."""
+    for pdf_path, result, error in outcomes:
+        yield pdf_path, result, error
+        for duplicate in duplicates.get(pdf_path, ()):
+            filename = os.path.basename(duplicate)
+            yield duplicate, dict(result, resume_filename=filename) if result else None, error
+
+def _hash_file(pdf_path: str) -> Optional[str]:
+    """Return the same BLAKE2b content hash the text cache uses, or None if unreadable."""
+    try:
+        with open(pdf_path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+def _strip_boilerplate(text: str) -> str:
+    """Collapse blank-line runs and drop a trailing References/Hobbies section.
+
+    The link lines extracted from the PDF's annotations are kept from the dropped section.
+    """
+    match = TRAILING_SECTION_RE.search(text, int(len(text) * TRAILING_SECTION_START))
+    if match:
+        links = LINK_LINE_RE.findall(match.group())
+        text = "\n".join([text[:match.start()], *links])
+    return BLANK_LINES_RE.sub('\n', text).strip()
+
+def _iter_pdfs(root: str):
+    """Yield paths of resume PDFs under root, skipping hidden directories like .git."""
+    for pdf_path in walk_pdfs(root, skip_hidden=True):
+        if 'resume' in os.path.basename(pdf_path).lower():
+            yield pdf_path
+
+def extract_text_from_pdf(pdf_path: str, data: Optional[bytes] = None) -> str:
+    """Extract text from PDF file including hyperlinks.
+
+    Defined at module level so it can run in a ProcessPoolExecutor worker. When the
+    file's bytes have already been read they can be passed as data, so the parsers
+    work from memory instead of reading the file again.
+    """
+    if data is None:
+        try:
+            with open(pdf_path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            logging.error(f"Could not read {pdf_path}: {e}")
+            return ""
+    try:
+        # Try with PyMuPDF first (better extraction)
+        doc = fitz.open(stream=data, filetype="pdf")
+        try:
+            buf = io.StringIO()
+            for page in doc:
+                buf.write(page.get_text("text"))
+                # Add hyperlinks to the text for LLM processing
+                for link in page.get_links():
+                    uri = link.get('uri')
+                    if uri:
+                        buf.write(_link_line(uri))
+            return buf.getvalue()
+        finally:
+            doc.close()
+    except Exception as e:
+        # pypdfium2 is the default fallback; FORCE_PYPDF2=1 restores the old pure-Python one
+        if os.environ.get("FORCE_PYPDF2"):
+            fallback_name, fallback = "PyPDF2", _extract_text_pypdf2
+        else:
+            fallback_name, fallback = "pypdfium2", _extract_text_pdfium
+        logging.warning(f"PyMuPDF failed for {pdf_path}: {e}, trying {fallback_name}")
+        try:
+            return fallback(data)
+        except Exception as e2:
+            logging.error(f"Both PDF extraction methods failed for {pdf_path}: {e2}")
+            return ""
+
+def _extract_text_pdfium(data: bytes) -> str:
+    pdf = pdfium.PdfDocument(data)
+    try:
+        return "".join(page.get_textpage().get_text_range() for page in pdf)
+    finally:
+        pdf.close()
+
+def _extract_text_pypdf2(data: bytes) -> str:
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return "".join(page.extract_text() for page in pdf_reader.pages)
+
+def load_resume_text(pdf_path: str, cache: Optional[ResumeCache] = None,
+                     content_hash: Optional[str] = None) -> Tuple[Optional[str], str]:
+    """Return (content_hash, text) for a PDF, using the text cache when one is given.
+
+    Pass content_hash when the file has already been hashed (see _hash_file) so a cache
+    hit never reads the file. The returned content_hash is None when caching is disabled.
+    Picklable, like extract_text_from_pdf.
+    """
+    if cache and content_hash:
+        text = cache.get_text(content_hash)
+        if text is not None:
+            return content_hash, text
+    # Read the file once; the same bytes are hashed and handed to the PDF parser
+    with open(pdf_path, 'rb') as f:
+        data = f.read()
+    if not cache:
+        content_hash = None
+    elif not content_hash:
+        content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+        text = cache.get_text(content_hash)
+        if text is not None:
+            return content_hash, text
+    text = extract_text_from_pdf(pdf_path, data)
+    if cache and text:
+        cache.put_text(content_hash, text)
+    return content_hash, text
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """One pooled HTTP client for the OpenAI and Groq SDK clients, so keep-alive connections
+    are reused by all workers and parsers instead of each client keeping its own pool.
+
+    Newer Anthropic SDKs ship their own HTTP stack and reject an httpx.Client, so the
+    Anthropic client keeps its own (still shared, via _build_client) pool.
+
+    The SDKs take their timeout from a client passed in, so it matches the OpenAI SDK's
+    default (5s to connect, 600s otherwise): a non-streamed response, especially a
+    batched one, sends nothing until it is complete.
+    """
+    return httpx.Client(limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+                        timeout=httpx.Timeout(600.0, connect=5.0))
+
+# API keys passed to ResumeLLMParser, by SHA-256, so _build_client's cache key holds only the hash
+_API_KEYS: Dict[str, str] = {}
+
+@lru_cache(maxsize=16)
+def _build_client(provider: str, model: str, key_hash: Optional[str]):
+    """Initialize the appropriate LLM client based on the provider.
+
+    Cached per (provider, model, key) so every parser and worker thread with the same
+    configuration shares one client and its HTTP connection pool. The key is looked up
+    in _API_KEYS by key_hash, so the raw key is not part of the cache key; with no
+    key_hash the provider's environment variable is used.
+    """
+    api_key = _API_KEYS.get(key_hash) if key_hash else None
+    if provider == "groq":
+        final_api_key = api_key or os.getenv("GROQ_API_KEY")
+        if not final_api_key:
+            raise ValueError(
+                "❌ Groq API key required! Set GROQ_API_KEY environment variable or use --api-key\n"
+                "💡 Get your free API key at: https://console.groq.com/keys"
+            )
+        try:
+            groq_client = Groq(api_key=final_api_key, http_client=_shared_http_client())
+            return instructor.from_groq(groq_client, model=model)
+        except Exception as e:
+            raise ValueError(f"❌ Failed to initialize Groq client: {e}\n💡 Check your API key is valid")
+            
+    elif provider == "openai":
+        final_api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not final_api_key:
+            raise ValueError(
+                "❌ OpenAI API key required! Set OPENAI_API_KEY environment variable or use --api-key\n"
+                "💡 Get your API key at: https://platform.openai.com/api-keys"
+            )
+        try:
+            openai_client = OpenAI(api_key=final_api_key, http_client=_shared_http_client())
+            return instructor.from_openai(openai_client, model=model)
+        except Exception as e:
+            raise ValueError(f"❌ Failed to initialize OpenAI client: {e}\n💡 Check your API key is valid")
+            
+    elif provider == "anthropic":
+        final_api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        if not final_api_key:
+            raise ValueError(
+                "❌ Anthropic API key required! Set ANTHROPIC_API_KEY environment variable or use --api-key\n"
+                "💡 Get your API key at: https://console.anthropic.com/account/keys"
+            )
+        try:
+            anthropic_client = anthropic.Anthropic(api_key=final_api_key)
+            return instructor.from_anthropic(anthropic_client, model=model, mode=instructor.Mode.ANTHROPIC_JSON)
+        except Exception as e:
+            raise ValueError(f"❌ Failed to initialize Anthropic client: {e}\n💡 Check your API key is valid")
+            
+    elif provider == "gemini":
+        final_api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        if not final_api_key:
+            raise ValueError(
+                "❌ Google API key required! Set GOOGLE_API_KEY environment variable or use --api-key\n"
+                "💡 Get your API key at: https://makersuite.google.com/app/apikey"
+            )
+        try:
+            genai.configure(api_key=final_api_key)
+            gemini_model = genai.GenerativeModel(model_name=model)
+            return instructor.from_gemini(client=gemini_model, mode=instructor.Mode.GEMINI_JSON)
+        except Exception as e:
+            raise ValueError(f"❌ Failed to initialize Gemini client: {e}\n💡 Check your API key is valid")
+    else:
+        raise ValueError(f"❌ Unsupported provider: {provider}\n💡 Supported providers: groq, openai, anthropic, gemini")
 
 class ResumeLLMParser:
-    def __init__(self, provider: str = "groq", model: str = "llama-3.3-70b-versatile", api_key: Optional[str] = None, max_workers: int = 4):
+    def __init__(self, provider: str = "groq", model: str = "llama-3.3-70b-versatile", api_key: Optional[str] = None, max_workers: int = 4,
+                 requests_per_minute: float = 120, tokens_per_minute: Optional[float] = None,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR, resumes_per_call: int = 1, batch_api: bool = False,
+                 max_resume_tokens: int = RESUME_TEXT_TOKENS):
         """Initialize the LLM-based resume parser.
         
         Args:
@@ -155,379 +728,216 @@ class ResumeLLMParser:
             model: The model to use. Works with any model supported by instructor for the chosen provider
             api_key: API key for the selected model provider
             max_workers: Maximum number of concurrent threads (default: 4)
+            requests_per_minute: Request budget shared by all workers (default: 120)
+            tokens_per_minute: Optional token budget shared by all workers (default: unlimited)
+            cache_dir: Directory for cached PDF text and LLM results, or None to disable caching
+            resumes_per_call: Maximum resumes packed into a single LLM request (default: 1)
+            batch_api: Submit all resumes as one OpenAI Batch API job instead of live requests
+            max_resume_tokens: Resume text tokens sent per request (default: 4096)
         """
+        if batch_api and provider != "openai":
+            raise ValueError("❌ The Batch API is only supported with --provider openai")
+        if resumes_per_call < 1:
+            raise ValueError("❌ --resumes-per-call must be at least 1")
         self.provider = provider
         self.model = model
         self.api_key = api_key
         self.max_workers = max_workers
-        self.rate_limit_lock = threading.Lock()
-        self.last_request_time = 0
-        # Initialize a client for testing connection
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.encoding = _get_encoding(model)
+        self.static_prompt_tokens = len(self.encoding.encode(SYSTEM_PROMPT))
+        context_tokens = MODEL_CONTEXT_TOKENS.get(model, DEFAULT_CONTEXT_TOKENS)
+        # Resume text may use whatever the prompt and the expected response leave free, up to max_resume_tokens
+        self.max_input_tokens = min(max_resume_tokens,
+                                    context_tokens - self.static_prompt_tokens - EXPECTED_OUTPUT_TOKENS - CONTEXT_SAFETY_TOKENS)
+        self.resumes_per_call = resumes_per_call
+        self.batch_api = batch_api
+        # Larger batches would ask for more response tokens than the model can return
+        max_batch_size = min(resumes_per_call,
+                             max(1, MODEL_OUTPUT_TOKENS.get(model, DEFAULT_OUTPUT_TOKENS) // EXPECTED_OUTPUT_TOKENS))
+        if max_batch_size < resumes_per_call:
+            logging.info(f"{model} returns too few tokens for {resumes_per_call} resumes per call, "
+                         f"using {max_batch_size}")
+        self.batcher = DynamicTokenBatcher(
+            self.encoding,
+            max_batch_tokens=context_tokens - self.static_prompt_tokens,
+            max_batch_size=max_batch_size,
+            max_text_tokens=self.max_input_tokens
+        )
+        self.cache = ResumeCache(cache_dir) if cache_dir else None
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        self._stats_lock = threading.Lock()
+        # Compile the user message templates once instead of formatting per resume
+        self._prompt_template = string.Template(USER_PROMPT_SRC)
+        self._batch_entry_template = string.Template(BATCH_ENTRY_SRC)
+        # Initialize a client for testing connection; it is shared by all worker threads
         self.client = self._initialize_client(provider, model, api_key)
         
     def _initialize_client(self, provider: str, model: str, api_key: Optional[str] = None):
         """Initialize the appropriate LLM client based on the provider."""
-        if provider == "groq":
-            final_api_key = api_key or os.getenv("GROQ_API_KEY")
-            if not final_api_key:
-                raise ValueError(
-                    "❌ Groq API key required! Set GROQ_API_KEY environment variable or use --api-key\n"
-                    "💡 Get your free API key at: https://console.groq.com/keys"
-                )
-            try:
-                groq_client = Groq(api_key=final_api_key)
-                return instructor.from_groq(groq_client, model=model)
-            except Exception as e:
-                raise ValueError(f"❌ Failed to initialize Groq client: {e}\n💡 Check your API key is valid")
-                
-        elif provider == "openai":
-            final_api_key = api_key or os.getenv("OPENAI_API_KEY")
-            if not final_api_key:
-                raise ValueError(
-                    "❌ OpenAI API key required! Set OPENAI_API_KEY environment variable or use --api-key\n"
-                    "💡 Get your API key at: https://platform.openai.com/api-keys"
-                )
-            try:
-                openai_client = OpenAI(api_key=final_api_key)
-                return instructor.from_openai(openai_client, model=model)
-            except Exception as e:
-                raise ValueError(f"❌ Failed to initialize OpenAI client: {e}\n💡 Check your API key is valid")
-                
-        elif provider == "anthropic":
-            final_api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-            if not final_api_key:
-                raise ValueError(
-                    "❌ Anthropic API key required! Set ANTHROPIC_API_KEY environment variable or use --api-key\n"
-                    "💡 Get your API key at: https://console.anthropic.com/account/keys"
-                )
-            try:
-                anthropic_client = anthropic.Anthropic(api_key=final_api_key)
-                return instructor.from_anthropic(anthropic_client, model=model, mode=instructor.Mode.ANTHROPIC_JSON)
-            except Exception as e:
-                raise ValueError(f"❌ Failed to initialize Anthropic client: {e}\n💡 Check your API key is valid")
-                
-        elif provider == "gemini":
-            final_api_key = api_key or os.getenv("GOOGLE_API_KEY")
-            if not final_api_key:
-                raise ValueError(
-                    "❌ Google API key required! Set GOOGLE_API_KEY environment variable or use --api-key\n"
-                    "💡 Get your API key at: https://makersuite.google.com/app/apikey"
-                )
-            try:
-                genai.configure(api_key=final_api_key)
-                gemini_model = genai.GenerativeModel(model_name=model)
-                return instructor.from_gemini(client=gemini_model, mode=instructor.Mode.GEMINI_JSON)
-            except Exception as e:
-                raise ValueError(f"❌ Failed to initialize Gemini client: {e}\n💡 Check your API key is valid")
-        else:
-            raise ValueError(f"❌ Unsupported provider: {provider}\n💡 Supported providers: groq, openai, anthropic, gemini")
+        key_hash = None
+        if api_key:
+            key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+            _API_KEYS[key_hash] = api_key
+        return _build_client(provider, model, key_hash)
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF file including hyperlinks."""
-        try:
-            # Try with PyMuPDF first (better extraction)
-            doc = fitz.open(pdf_path)
-            text = ""
-            links = []
-            
-            for page in doc:
-                # Extract regular text
-                page_text = page.get_text()
-                
-                # Extract hyperlinks
-                page_links = page.get_links()
-                for link in page_links:
-                    if 'uri' in link:
-                        uri = link['uri']
-                        # Add the link to our text for LLM processing
-                        if 'github' in uri.lower():
-                            page_text += f"\nGitHub: {uri}"
-                        elif 'linkedin' in uri.lower():
-                            page_text += f"\nLinkedIn: {uri}"
-                        else:
-                            page_text += f"\nLink: {uri}"
-                
-                text += page_text
-            
-            doc.close()
-            return text
-        except Exception as e:
-            logging.warning(f"PyMuPDF failed for {pdf_path}: {e}, trying PyPDF2")
-            try:
-                # Fallback to PyPDF2
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text()
-                    return text
-            except Exception as e2:
-                logging.error(f"Both PDF extraction methods failed for {pdf_path}: {e2}")
-                return ""
+        return extract_text_from_pdf(pdf_path)
     
     def _get_client(self):
-        """Get a fresh client instance for thread-safe usage."""
+        """Get the client shared by every parser with this provider, model and key."""
         return self._initialize_client(self.provider, self.model, self.api_key)
     
-    def _rate_limited_request(self, delay: float = 0.5):
-        """Ensure minimum delay between requests to respect rate limits."""
-        with self.rate_limit_lock:
-            now = time.time()
-            time_since_last = now - self.last_request_time
-            if time_since_last < delay:
-                time.sleep(delay - time_since_last)
-            self.last_request_time = time.time()
+    def _truncate_to_budget(self, resume_text: str) -> str:
+        """Trim resume text to the tokens left in the context window after the prompt and response."""
+        # A byte-level BPE token covers at least one UTF-8 byte (a CJK character or emoji can
+        # take several tokens), so only texts this short in bytes can skip encoding
+        if len(resume_text.encode('utf-8')) <= self.max_input_tokens:
+            return resume_text
+        tokens = self.encoding.encode(resume_text)
+        if len(tokens) <= self.max_input_tokens:
+            return resume_text
+        return self.encoding.decode(tokens[:self.max_input_tokens])
     
     def parse_resume_with_llm(self, resume_text: str, filename: str) -> Optional[ResumeData]:
         """Use LLM to parse and extract structured data from resume text."""
         
-        prompt = f"""Analyze this resume and extract the following information. Be precise and realistic in your assessments.
-
-IMPORTANT: 
-- Set resume_filename to: {filename}
-- ALL field names must match EXACTLY (no extra spaces or typos)
-- ALL required fields must be present - do not skip any fields
-- Use empty string "" for missing links, not null
-- Return VALID JSON only - no extra text, tags, or formatting
-- Do not add [/function] or any closing tags
-
-RESUME TEXT:
-{resume_text[:8000]}  # Limit text to avoid token limits
-
-Please extract and evaluate:
-
-1. Basic Information:
-   - Full name (if not clear from text, extract from filename) - avoid special characters like apostrophes
-   - Email address
-   - GitHub and LinkedIn URLs (return empty string if not found)
-   - Location (country and city)
-   - Estimated job level based on experience and skills:
-     * Intern: Student or recent grad with no professional experience, internships only
-     * L3/AMTS (Associate Member of Technical Staff): 0-2 years, entry level, recent grad
-     * L4/MTS (Member of Technical Staff): 2-4 years, mid-level individual contributor
-     * L5/SMTS (Senior Member of Technical Staff): 4-7 years, senior individual contributor
-     * L6/LMTS (Lead Member of Technical Staff): 7-10 years, tech lead, some management
-     * L7/PMTS (Principal Member of Technical Staff): 10+ years, principal engineer, architect
-     * L8/Architect: 12+ years, distinguished engineer, technical leadership
-
-2. Experience (use decimal years like 2.5 when appropriate):
-   - Years of programming/software development experience in professional settings (not including education)
-   - Years of AI/ML experience (use 0 if none)
-   - Years of cloud experience (AWS, Azure, GCP - use 0 if none)
-   - Years of LLM/NLP experience (use 0 if none)
-
-3. Education:
-   - Total years of college education (4 for bachelors, 6 for masters, 8+ for PhD)
-   - Highest degree obtained
-   - Bachelor's university name (full name)
-   - Graduate university name (Masters/PhD) - empty string if none
-   - University tier for CS program (consider best university attended):
-     * Tier 1: Top schools (MIT, Stanford, CMU, Berkeley, etc.)
-     * Tier 2: Excellent schools (Purdue, UCLA, UCSD, Georgia Tech, etc.)
-     * Tier 3: Good schools (state universities, well-known regionals)
-     * Tier 4: Average schools
-     * Tier 5: Below average or unknown
-   - Overall world ranking of best university attended (estimate 1-2000+, use 0 if completely unknown)
-     Examples Overall: MIT=2, Stanford=3, Harvard=1, Berkeley=14, Purdue=126, Arizona State=1100, Western Michigan=1200
-   - CS program world ranking of best university attended (estimate 1-500+, use 0 if completely unknown)  
-     Examples CS: MIT=1, Stanford=2, Berkeley=3, Purdue=20, Arizona State=85, Western Michigan=200+
-   - Bachelor's GPA (0.0-4.0 scale, use 0.0 if not mentioned)
-   - Master's GPA (0.0-4.0 scale, use 0.0 if not mentioned or no master's degree)
-
-4. Work Experience:
-   - List ALL companies worked at, ordered from most recent to oldest (comma-separated)
-   - Company tier based on most impressive employer:
-     * Tier 1: FAANG, top tech companies (Google, Meta, Amazon, Microsoft, Apple, OpenAI, etc.)
-     * Tier 2: Well-known tech companies, unicorns (Uber, Airbnb, Stripe, etc.)
-     * Tier 3: Established non-tech companies, consulting firms
-     * Tier 4: Startups, smaller companies
-     * Tier 5: Unknown or no work experience
-
-5. Skill Levels (1-5 scale):
-   - JavaScript/TypeScript skill level:
-     * 1 = No experience
-     * 2 = Basic (learning, tutorials, simple projects)
-     * 3 = Intermediate (used professionally, can build features)
-     * 4 = Advanced (expert user, complex projects, mentors others)
-     * 5 = Expert (thought leader, open source contributor, architect level)
-   
-   - Python skill level (same 1-5 scale)
-   
-   - Cloud infrastructure skill level (AWS/Azure/GCP):
-     * 1 = No experience
-     * 2 = Basic (used some services)
-     * 3 = Intermediate (deployed applications, used multiple services)
-     * 4 = Advanced (designed architectures, cost optimization, security)
-     * 5 = Expert (certified, large-scale systems, infrastructure as code)
-   
-   - LLM/NLP skill level:
-     * 1 = No experience
-     * 2 = Basic (used APIs, simple prompts)
-     * 3 = Intermediate (fine-tuning, RAG, prompt engineering)
-     * 4 = Advanced (built production systems, model optimization)
-     * 5 = Expert (research, custom models, published papers)
-
-   - Number of CS-related internships
-
-6. Frontend Stack Skills (1-5 scale):
-   - React.js strength (1=none, 5=expert with production experience)
-   - TypeScript strength (1=none, 5=expert level)
-   - Next.js strength (1=none, 5=expert)
-   - REST API design strength (1=none, 5=designed complex APIs)
-   - Tailwind CSS strength (1=none, 5=expert)
-   - Git/GitHub strength (1=none, 5=advanced workflows)
-   - Agile/Scrum strength (1=none, 5=led sprints)
-   
-   Also extract:
-   - AWS services used (list specific services like Lambda, S3, etc.)
-   - Database technologies used (PostgreSQL, MongoDB, DynamoDB, etc.)
-   - AI developer tools used (Cursor, Claude Code, Copilot, etc.)
-   - LLM APIs used (OpenAI, Anthropic, Gemini, etc.)
-
-7. Work Style & Independence Indicators:
-   - Startup experience strength (1=none, 5=founded or early employee)
-   - Open source contribution strength (1=none, 5=maintainer)
-   - Leadership strength (1=none, 5=managed teams)
-   - Evidence of autonomous work (freelance, solo projects, etc.)
-
-8. CS Fundamentals:
-   - Algorithm/data structure strength (1-5, based on education, competitions, projects)
-   - System design strength (1=none, 5=designed large systems)
-
-9. EXPERIENCE-RELATIVE AGGREGATE SCORES (1-10 scale, ALL RELATIVE TO JOB LEVEL):
-   IMPORTANT: Score these relative to what would be exceptional for someone at their experience level.
-   An L3/AMTS should be compared to other L3/AMTS-level engineers, not to L7/PMTS-level engineers.
-   
-   - Academic Strength (1-10): Consider overall/CS world ranking, GPA, degrees, research FOR THEIR LEVEL
-     * 10 = Top 5 world universities (MIT, Stanford, Harvard, etc.) with high GPA for their level
-     * 8-9 = Top 50 world universities with good performance for their level
-     * 6-7 = Top 200 world universities OR strong GPA at lower-ranked school for their level
-     * 4-5 = Top 500-1000 universities with average performance for their level
-     * 1-3 = Universities ranked 1000+ or poor academic performance for their level
-     IMPORTANT: Weight CS ranking more heavily than overall ranking for CS-related roles
-   
-   - CS Strength (1-10): Algorithms, data structures, system design, competitions
-     * 10 = International competition winner, exceptional CS knowledge for experience level
-     * 8-9 = Strong algorithmic thinking, competition experience for experience level
-     * 6-7 = Solid CS fundamentals for their experience level
-     * 4-5 = Basic CS knowledge for level
-     * 1-3 = Weak CS fundamentals for level
-   
-   - Industry Strength (1-10): Quality of work experience relative to experience level
-     * 10 = FAANG/top tech companies, exceptional roles for experience level
-     * 8-9 = Excellent companies for someone at their experience level
-     * 6-7 = Good industry experience for experience level
-     * 4-5 = Some industry experience appropriate for level
-     * 1-3 = Below average experience for level
-   
-   - Full-Stack Strength (1-10): Frontend + Backend + Cloud capabilities for experience level
-     * 10 = Production-level full-stack expertise exceptional for experience level
-     * 8-9 = Strong across the stack for their experience level
-     * 6-7 = Competent in multiple areas for level
-     * 4-5 = Some full-stack exposure for level
-     * 1-3 = Limited full-stack skills for level
-   
-   - Open Source Strength (1-10): GitHub contributions, projects relative to experience level
-     * 10 = Major open source contributor/maintainer exceptional for experience level
-     * 8-9 = Active contributor with significant projects for experience level
-     * 6-7 = Some contributions and personal projects for level
-     * 4-5 = Few personal projects for level
-     * 1-3 = No open source presence
-   
-   - Accomplishments Strength (1-10): Awards, publications, impact relative to experience level
-     * 10 = Exceptional achievements for experience level (founded company, published papers, major awards)
-     * 8-9 = Impressive accomplishments for someone at their experience level
-     * 6-7 = Good achievements for experience level
-     * 4-5 = Some noteworthy items for level
-     * 1-3 = Few accomplishments for level
-   
-   - Overall Score: Calculate the average of the above 6 scores (round to 1 decimal)
-
-10. Top 3 Accomplishments:
-   - Extract the three most impressive accomplishments from the resume
-   - Look for quantifiable impacts, awards, publications, leadership roles, etc.
-
-Be accurate and conservative in your estimates. If information is not clear, make reasonable inferences based on the context."""
-
+        user_content = self._prompt_template.substitute(filename=filename, resume_text=self._truncate_to_budget(resume_text))
+        
         try:
-            # Rate limit API calls
-            self._rate_limited_request()
-            
-            # Get a thread-local client
-            client = self._get_client()
-            
-            # Make the API call with retry logic
-            for attempt in range(3):
-                try:
-                    logging.info(f"Sending resume to LLM for parsing (attempt {attempt + 1}/3)")
-                    
-                    response = client.chat.completions.create(
-                        response_model=ResumeData,
-                        messages=[{"role": "user", "content": prompt}],
-                        max_retries=2  # Let instructor handle some retries too
-                    )
-                    
-                    return response
-                    
-                except Exception as e:
-                    error_str = str(e)
-                    
-                    # Handle rate limits and server errors
-                    if ("429" in error_str or "rate limit" in error_str.lower() or 
-                        "500" in error_str or "internal server error" in error_str.lower()):
-                        wait_time = 10 * (attempt + 1)  # Exponential backoff
-                        if "500" in error_str:
-                            logging.warning(f"Server error, waiting {wait_time}s before retry: {error_str[:100]}")
-                        else:
-                            logging.warning(f"Rate limit hit, waiting {wait_time}s before retry")
-                        time.sleep(wait_time)
-                        continue
-                    
-                    # Handle validation errors - try once more with stricter prompt
-                    elif ("tool call validation failed" in error_str or 
-                          "Failed to call a function" in error_str) and attempt < 2:
-                        logging.warning(f"Validation error, retrying with stricter prompt: {error_str[:200]}")
-                        # Add stricter instructions for second attempt
-                        strict_prompt = prompt + """
-
-CRITICAL: Your response must include ALL these exact field names:
-resume_filename, candidate_name, email, github_link, linkedin_link, country, city, estimated_job_level, programming_experience_years, ai_experience_years, college_education_years, highest_degree, bachelors_university, graduate_university, university_tier, overall_world_ranking, cs_world_ranking, bachelors_gpa, masters_gpa, companies_worked, company_tier, javascript_skill_level, python_skill_level, cloud_skill_level, llm_skill_level, cs_internships, cloud_experience_years, llm_experience_years, react_strength, typescript_strength, nextjs_strength, api_design_strength, tailwind_strength, git_strength, agile_strength, aws_services_experience, database_technologies, ai_tools_experience, llm_api_experience, startup_experience_strength, open_source_strength, leadership_strength, autonomy_indicators, algorithms_strength, system_design_strength, academic_strength, cs_strength, industry_strength, fullstack_strength, opensource_strength, accomplishments_strength, overall_score, accomplishment_1, accomplishment_2, accomplishment_3
-
-EXACT field count required: 50 fields
-DO NOT add extra spaces, typos, or skip any fields.
-Return clean JSON without any extra tags or text."""
-                        
-                        prompt = strict_prompt
-                        continue
-                    else:
-                        raise
-                        
+            return self._single_llm_call(user_content)
         except Exception as e:
             logging.error(f"Failed to parse resume with LLM: {e}")
             return None
     
-    def process_resume(self, pdf_path: str) -> Optional[Dict]:
-        """Process a single resume PDF file."""
+    def parse_resumes_batch(self, items: List[Tuple[str, str]]) -> List[Optional[ResumeData]]:
+        """Parse several (filename, resume_text) pairs with a single LLM request.
+        
+        Entries are matched back to items by INDEX, since filenames need not be unique.
+        Returns one entry per item, or all None (so each resume is retried on its own)
+        when the indexes in the response do not match the items one to one.
+        """
+        parts = [f"Return one entry in resumes for each of the {len(items)} resumes below, in the same order, "
+                 "with index set to the resume's INDEX."]
+        for index, (filename, resume_text) in enumerate(items):
+            parts.append(self._batch_entry_template.substitute(
+                index=index, filename=filename, resume_text=self._truncate_to_budget(resume_text)))
+        user_content = "\n".join(parts)
+        
+        try:
+            batch = self._single_llm_call(user_content, ResumeBatch, EXPECTED_OUTPUT_TOKENS * len(items))
+        except Exception as e:
+            logging.error(f"Failed to parse resume batch with LLM: {e}")
+            return [None] * len(items)
+        
+        by_index = {resume.index: resume for resume in batch.resumes}
+        if len(batch.resumes) != len(items) or set(by_index) != set(range(len(items))):
+            logging.warning(f"⚠️ Batched response did not match its {len(items)} resumes one to one, retrying them singly")
+            return [None] * len(items)
+        return [ResumeData.model_validate(by_index[index].model_dump(exclude={'index'}) | {'resume_filename': filename})
+                for index, (filename, _) in enumerate(items)]
+    
+    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(5),
+           retry=retry_if_exception(_is_retryable_api_error), before_sleep=_log_api_retry, reraise=True)
+    def _single_llm_call(self, user_content: str, response_model: Type[BaseModel] = ResumeData,
+                         output_tokens: int = EXPECTED_OUTPUT_TOKENS) -> BaseModel:
+        """Send one request to the LLM, backing off with jitter on rate limits and server errors."""
+        # Every attempt is a request against the provider's RPM/TPM budget
+        self.rate_limiter.acquire(self.static_prompt_tokens + len(self.encoding.encode(user_content)) + output_tokens)
+        logging.info("Sending resume to LLM for parsing")
+        if self.provider == "anthropic":
+            # Mark the static instructions as a cacheable prefix
+            request = {
+                "system": [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}],
+                "messages": [{"role": "user", "content": user_content}],
+                # Anthropic requires an explicit output limit; instructor defaults it to 4096
+                "max_tokens": max(4096, output_tokens),
+            }
+        else:
+            request = {
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_content},
+                ],
+            }
+        return self._get_client().chat.completions.create(
+            response_model=response_model,
+            max_retries=3,  # instructor re-asks with the validation errors when the response does not fit ResumeData
+            **request
+        )
+    
+    def _prepare_resume(self, pdf_path: str, extraction: Optional[Future] = None) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+        """Extract a resume's text and look up any cached result.
+        
+        Returns (cached_result, text, result_key); text is None when the resume cannot
+        or need not be sent to the LLM (the reason has already been logged).
+        """
         filename = os.path.basename(pdf_path)
         
         # Check if file exists and is readable
         if not os.path.exists(pdf_path):
             logging.error(f"❌ File not found: {pdf_path}")
-            return None
+            return None, None, None
             
         if not os.access(pdf_path, os.R_OK):
             logging.error(f"❌ Cannot read file (permission denied): {filename}")
-            return None
+            return None, None, None
         
-        # Extract text from PDF
+        # Extract text from PDF, reusing cached results for identical file contents
         try:
-            text = self.extract_text_from_pdf(pdf_path)
-            if not text or len(text.strip()) < 50:
-                logging.warning(f"⚠️ Little or no text extracted from {filename} (might be image-based PDF)")
-                return None
+            if extraction is not None:
+                _, text = extraction.result()
+            else:
+                _, text = load_resume_text(pdf_path, self.cache)
         except Exception as e:
             logging.error(f"❌ PDF extraction failed for {filename}: {str(e)[:100]}...")
+            return None, None, None
+        
+        text = _strip_boilerplate(text or '')
+        if len(text) < 50:
+            logging.warning(f"⚠️ Little or no text extracted from {filename} (might be image-based PDF)")
+            return None, None, None
+        
+        result_key = None
+        if self.cache:
+            result_key = self.cache.result_key(text, self.provider, self.model)
+            cached = self.cache.get_result(result_key)
+            with self._stats_lock:
+                self.cache_stats['hits' if cached else 'misses'] += 1
+            if cached:
+                cached['resume_filename'] = filename
+                return cached, None, result_key
+        
+        return None, text, result_key
+    
+    def _finish_resume(self, filename: str, resume_data: ResumeData, result_key: Optional[str]) -> Optional[Dict]:
+        """Cache a parsed resume and convert it to a CSV row."""
+        if self.cache:
+            try:
+                self.cache.put_result(result_key, resume_data)
+            except OSError as e:
+                logging.warning(f"Could not cache result for {filename}: {e}")
+        
+        # Convert to dictionary
+        try:
+            return resume_data.model_dump()
+        except Exception as e:
+            logging.error(f"❌ Data conversion failed for {filename}: {str(e)[:100]}...")
             return None
+    
+    def process_resume(self, pdf_path: str, extraction: Optional[Future] = None) -> Optional[Dict]:
+        """Process a single resume PDF file.
+        
+        Args:
+            pdf_path: Path to the resume PDF
+            extraction: Optional future for load_resume_text(pdf_path, self.cache) that is
+                already running in a process pool; extracted inline when omitted
+        """
+        filename = os.path.basename(pdf_path)
+        cached, text, result_key = self._prepare_resume(pdf_path, extraction)
+        if text is None:
+            return cached
         
         # Parse with LLM
         try:
@@ -539,22 +949,275 @@ Return clean JSON without any extra tags or text."""
             logging.error(f"❌ LLM parsing failed for {filename}: {str(e)[:100]}...")
             return None
         
-        # Convert to dictionary
-        try:
-            return resume_data.dict()
-        except Exception as e:
-            logging.error(f"❌ Data conversion failed for {filename}: {str(e)[:100]}...")
-            return None
+        return self._finish_resume(filename, resume_data, result_key)
 
-    def process_resume_parallel_safe(self, pdf_path: str) -> tuple[str, Optional[Dict], Optional[str]]:
+    def process_resume_parallel_safe(self, pdf_path: str, extraction: Optional[Future] = None) -> tuple[str, Optional[Dict], Optional[str]]:
         """Thread-safe wrapper for process_resume that returns (path, result, error)."""
         try:
-            result = self.process_resume(pdf_path)
+            result = self.process_resume(pdf_path, extraction)
             return (pdf_path, result, None)
         except Exception as e:
             error_msg = f"Processing error: {str(e)[:100]}..."
             return (pdf_path, None, error_msg)
     
+    def process_resume_batch(self, items: List[Tuple[str, Optional[Future]]]) -> List[tuple[str, Optional[Dict], Optional[str]]]:
+        """Process several resumes with as few LLM requests as fit the context window.
+        
+        Takes (pdf_path, extraction) pairs like process_resume and returns a
+        (path, result, error) tuple per resume, in order. Resumes missing from a
+        batched response are retried on their own.
+        """
+        outcomes = {}
+        pending = []
+        result_keys = {}
+        for pdf_path, extraction in items:
+            try:
+                cached, text, result_key = self._prepare_resume(pdf_path, extraction)
+            except Exception as e:
+                outcomes[pdf_path] = (pdf_path, None, f"Processing error: {str(e)[:100]}...")
+                continue
+            if text is None:
+                outcomes[pdf_path] = (pdf_path, cached, None)
+            else:
+                pending.append((pdf_path, text))
+                result_keys[pdf_path] = result_key
+        
+        for batch in self.batcher.pack(pending):
+            parsed = self.parse_resumes_batch([(os.path.basename(pdf_path), text) for pdf_path, text in batch])
+            for (pdf_path, text), resume_data in zip(batch, parsed):
+                filename = os.path.basename(pdf_path)
+                if resume_data is None:
+                    resume_data = self.parse_resume_with_llm(text, filename)
+                if resume_data is None:
+                    logging.warning(f"⚠️ LLM parsing returned no data for {filename}")
+                    outcomes[pdf_path] = (pdf_path, None, None)
+                    continue
+                outcomes[pdf_path] = (pdf_path, self._finish_resume(filename, resume_data, result_keys[pdf_path]), None)
+        
+        return [outcomes[pdf_path] for pdf_path, _ in items]
+    
+    def _process_from_queue(self, handoff: queue.Queue, count: int = 1):
+        """Take the next count (pdf_path, extraction) pairs off handoff and process them.
+        
+        Returns a (path, result, error) tuple, or a list of them when resumes are batched.
+        """
+        items = [handoff.get() for _ in range(count)]
+        if self.resumes_per_call > 1:
+            return self.process_resume_batch(items)
+        return self.process_resume_parallel_safe(*items[0])
+    
+    def submit_batch(self, items: List[Tuple[str, str]]) -> str:
+        """Upload (custom_id, resume_text) pairs as an OpenAI Batch API job and return its id.
+        
+        Each request mirrors the live call: the same system prompt, user message and
+        ResumeData function schema that instructor sends in TOOLS mode.
+        """
+        tool = instructor.openai_schema(ResumeData).openai_schema
+        lines = []
+        for custom_id, resume_text in items:
+            user_content = self._prompt_template.substitute(
+                filename=custom_id, resume_text=self._truncate_to_budget(resume_text))
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": user_content},
+                    ],
+                    "tools": [{"type": "function", "function": tool}],
+                    "tool_choice": {"type": "function", "function": {"name": tool["name"]}},
+                },
+            }))
+        client = self._openai_batch_client()
+        batch_file = client.files.create(file=("resumes.jsonl", "\n".join(lines).encode('utf-8')), purpose="batch")
+        batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions",
+                                      completion_window="24h")
+        return batch.id
+    
+    def _openai_batch_client(self) -> OpenAI:
+        return OpenAI(api_key=self.api_key or os.getenv("OPENAI_API_KEY"), http_client=_shared_http_client())
+    
+    def _wait_for_batch(self, batch_id: str) -> Tuple[Dict[str, ResumeData], Dict[str, str]]:
+        """Poll a Batch API job until it finishes.
+        
+        Returns (parsed, failures): the parsed resume per custom_id, and the reason per
+        custom_id for requests listed in the job's error file.
+        """
+        client = self._openai_batch_client()
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                break
+            counts = batch.request_counts
+            done = f"{counts.completed + counts.failed}/{counts.total}" if counts else "?"
+            logging.info(f"⏳ Batch {batch_id} is {batch.status} ({done} requests done)")
+            time.sleep(BATCH_API_POLL_SECONDS)
+        
+        if batch.status != "completed":
+            logging.error(f"❌ Batch {batch_id} ended with status {batch.status}")
+            if batch.errors and batch.errors.data:
+                for error in batch.errors.data:
+                    logging.error(f"   {error.code}: {error.message}")
+        parsed = {}
+        if batch.output_file_id:
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                try:
+                    message = record["response"]["body"]["choices"][0]["message"]
+                    parsed[record["custom_id"]] = ResumeData.model_validate_json(
+                        message["tool_calls"][0]["function"]["arguments"])
+                except Exception as e:
+                    logging.warning(f"⚠️ Batch response for {record.get('custom_id')} could not be parsed: {str(e)[:100]}")
+        failures = {}
+        if batch.error_file_id:
+            for line in client.files.content(batch.error_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                error = record.get("error") or ((record.get("response") or {}).get("body") or {}).get("error")
+                failures[record.get("custom_id")] = str(error.get("message") if isinstance(error, dict) else error)
+        return parsed, failures
+    
+    def _batch_api_outcomes(self, pdf_paths: List[str], extract_pool: ProcessPoolExecutor, executor: ThreadPoolExecutor,
+                            output_file: str, content_hashes: Optional[Dict[str, str]] = None):
+        """Process resumes through one OpenAI Batch API job, yielding (path, result, error) tuples.
+        
+        The job id is kept in a sidecar file next to the output, so an interrupted run
+        resumes polling the same job instead of submitting (and paying for) a new one.
+        Resumes whose batch request failed are retried with live requests on executor.
+        """
+        sidecar = f"{output_file}.batch.json"
+        resumed = os.path.exists(sidecar)
+        if resumed:
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                job = json.load(f)
+            logging.info(f"Resuming Batch API job {job['batch_id']} from {sidecar}")
+        else:
+            job = {'batch_id': None, 'paths': {}, 'result_keys': {}}
+            items = []
+            content_hashes = content_hashes or {}
+            extractions = [(pdf_path, extract_pool.submit(load_resume_text, pdf_path, self.cache, content_hashes.get(pdf_path)))
+                           for pdf_path in pdf_paths]
+            for pdf_path, extraction in extractions:
+                try:
+                    cached, text, result_key = self._prepare_resume(pdf_path, extraction)
+                except Exception as e:
+                    yield (pdf_path, None, f"Processing error: {str(e)[:100]}...")
+                    continue
+                if text is None:
+                    yield (pdf_path, cached, None)
+                    continue
+                custom_id = str(len(items))
+                items.append((custom_id, text))
+                job['paths'][custom_id] = pdf_path
+                job['result_keys'][custom_id] = result_key
+            if not items:
+                return
+            job['batch_id'] = self.submit_batch(items)
+            with open(sidecar, 'w', encoding='utf-8') as f:
+                json.dump(job, f)
+            logging.info(f"📤 Submitted {len(items)} resumes as Batch API job {job['batch_id']}")
+        
+        parsed, failures = self._wait_for_batch(job['batch_id'])
+        pending = set(pdf_paths)
+        fallback = []
+        for custom_id, pdf_path in job['paths'].items():
+            if pdf_path not in pending:
+                continue  # already written by the run that was interrupted
+            filename = os.path.basename(pdf_path)
+            resume_data = parsed.get(custom_id)
+            if resume_data is None:
+                if custom_id in failures:
+                    logging.warning(f"⚠️ Batch request for {filename} failed: {failures[custom_id][:100]}")
+                fallback.append(pdf_path)
+                continue
+            resume_data = resume_data.model_copy(update={'resume_filename': filename})
+            yield (pdf_path, self._finish_resume(filename, resume_data, job['result_keys'][custom_id]), None)
+        if fallback:
+            logging.info(f"🔁 Retrying {len(fallback)} resumes from the batch with live requests")
+            yield from self._live_outcomes(fallback, extract_pool, executor, content_hashes or {})
+        os.remove(sidecar)
+        
+        # Resumes added since a resumed job was submitted go into a job of their own
+        if resumed:
+            submitted = set(job['paths'].values())
+            remaining = [pdf_path for pdf_path in pdf_paths if pdf_path not in submitted]
+            if remaining:
+                yield from self._batch_api_outcomes(remaining, extract_pool, executor, output_file, content_hashes)
+    
+    def _live_outcomes(self, pdf_paths: List[str], extract_pool: ProcessPoolExecutor, executor: ThreadPoolExecutor,
+                       content_hashes: Dict[str, str]):
+        """Process resumes with live LLM requests, yielding outcomes as they finish.
+        
+        PDF extraction is CPU-bound, so it runs in worker processes while the LLM
+        threads only block on network I/O. A feeder thread keeps extractions queued
+        ahead of the LLM workers, so the next resumes are usually extracted by the
+        time a worker picks them up; the bounded handoff queue stops extraction from
+        running arbitrarily far ahead and holding every resume's text in memory.
+        """
+        handoff = queue.Queue(maxsize=self.max_workers * 2)
+        
+        def feed_extractions():
+            for pdf_path in pdf_paths:
+                try:
+                    extraction = extract_pool.submit(load_resume_text, pdf_path, self.cache, content_hashes.get(pdf_path))
+                except Exception as e:
+                    # Hand the failure to the LLM worker so it is reported per resume
+                    extraction = Future()
+                    extraction.set_exception(e)
+                handoff.put((pdf_path, extraction))
+        
+        threading.Thread(target=feed_extractions, daemon=True).start()
+        
+        # Each job processes whichever resumes are next in the queue
+        yield from self._windowed_outcomes(executor, handoff, len(pdf_paths))
+    
+    def _windowed_outcomes(self, executor: ThreadPoolExecutor, handoff: queue.Queue, total: int):
+        """Submit _process_from_queue jobs for total resumes and yield their outcomes as they finish.
+        
+        At most max_workers * 4 jobs are outstanding at a time, so memory stays constant
+        however many resumes there are.
+        """
+        window = self.max_workers * 4
+        step = self.resumes_per_call
+        pending = set()
+        for start in range(0, total, step):
+            pending.add(executor.submit(self._process_from_queue, handoff, min(step, total - start)))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+    
+    def _group_duplicates(self, pdf_paths: List[str], pool: ProcessPoolExecutor) -> Tuple[List[str], Dict[str, List[str]], Dict[str, str]]:
+        """Split pdf_paths into one path per distinct file content and the identical copies of each.
+        
+        Returns (unique_paths, duplicates, content_hashes) where duplicates maps a path in
+        unique_paths to the other paths with the same bytes, and content_hashes maps each
+        readable unique path to its hash so load_resume_text does not hash it again.
+        """
+        first_by_hash = {}
+        unique_paths = []
+        duplicates = {}
+        content_hashes = {}
+        for pdf_path, content_hash in zip(pdf_paths, pool.map(_hash_file, pdf_paths, chunksize=32)):
+            first = first_by_hash.setdefault(content_hash, pdf_path) if content_hash else pdf_path
+            if first == pdf_path:
+                unique_paths.append(pdf_path)
+                if content_hash:
+                    content_hashes[pdf_path] = content_hash
+            else:
+                duplicates.setdefault(first, []).append(pdf_path)
+        if duplicates:
+            logging.info(f"🔁 {len(pdf_paths) - len(unique_paths)} duplicate PDFs will reuse the result of an identical file")
+        return unique_paths, duplicates, content_hashes
+    
     def process_all_resumes(self, directory: str, output_file: str = 'resume_analysis.csv', 
                            sample_size: Optional[int] = None):
         """Process all PDF resumes in directory and subdirectories.
@@ -564,42 +1227,33 @@ Return clean JSON without any extra tags or text."""
             output_file: Output CSV filename
             sample_size: Optional limit on number of resumes to process
         """
-        results = []
         errors = []
-        pdf_files = []
+        
+        # Earlier runs kept progress in a .tmp file; adopt it as the output file so its
+        # rows are kept and new rows are appended after them
+        temp_file = f"{output_file}.tmp"
+        if not os.path.exists(output_file) and os.path.exists(temp_file):
+            logging.info(f"Found temp file {temp_file}, resuming from there...")
+            os.replace(temp_file, output_file)
         
         # Check for existing results to resume from
         already_processed = set()
         if os.path.exists(output_file):
             logging.info(f"Found existing output file {output_file}, checking for processed resumes...")
             try:
-                with open(output_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        results.append(row)
-                        already_processed.add(row['resume_filename'])
+                # Only the filename column is needed, so skip building a dict per row
+                with open(output_file, 'r', newline='', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None)
+                    if header:
+                        index = header.index('resume_filename')
+                        already_processed.update(row[index] for row in reader if len(row) > index)
                 logging.info(f"Resuming from existing file with {len(already_processed)} already processed resumes")
             except Exception as e:
                 logging.warning(f"Could not read existing file: {e}")
         
-        # Check for temp file if main file doesn't exist
-        elif os.path.exists(f"{output_file}.tmp"):
-            logging.info(f"Found temp file {output_file}.tmp, resuming from there...")
-            try:
-                with open(f"{output_file}.tmp", 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        results.append(row)
-                        already_processed.add(row['resume_filename'])
-                logging.info(f"Resuming from temp file with {len(already_processed)} already processed resumes")
-            except Exception as e:
-                logging.warning(f"Could not read temp file: {e}")
-        
         # Find all PDF files
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.pdf') and 'resume' in file.lower():
-                    pdf_files.append(os.path.join(root, file))
+        pdf_files = list(_iter_pdfs(directory))
         
         # Filter out already processed files
         pdf_files_to_process = []
@@ -628,6 +1282,11 @@ Return clean JSON without any extra tags or text."""
             logging.info("No new resumes to process!")
             return
         
+        # Rows are appended as each resume finishes, so the output file is always up to date.
+        # A writer thread does the disk I/O so a slow disk never stalls the completion loop.
+        error_file = output_file.replace('.csv', '_errors.csv')
+        csvfile, writer = self._open_results_csv(output_file)
+        
         # Process resumes in parallel
         success_count = 0
         pbar = tqdm(
@@ -637,75 +1296,74 @@ Return clean JSON without any extra tags or text."""
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}"
         )
         
+        write_q = queue.Queue()
+        writer_thread = threading.Thread(target=self._writer_loop, args=(write_q, csvfile, writer, error_file), daemon=True)
+        writer_thread.start()
+        
         try:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all jobs
-                future_to_path = {
-                    executor.submit(self.process_resume_parallel_safe, pdf_path): pdf_path 
-                    for pdf_path in pdf_files_to_process
-                }
+            # Text extraction runs in worker processes, LLM requests in worker threads
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as extract_pool, \
+                    ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Identical files are parsed once and the result is written for every copy
+                unique_paths, duplicates, content_hashes = self._group_duplicates(pdf_files_to_process, extract_pool)
+                
+                if self.batch_api:
+                    outcomes = self._batch_api_outcomes(unique_paths, extract_pool, executor, output_file, content_hashes)
+                else:
+                    outcomes = self._live_outcomes(unique_paths, extract_pool, executor, content_hashes)
                 
                 completed = 0
-                for future in as_completed(future_to_path):
-                    completed += 1
-                    pdf_path, result, error = future.result()
-                    filename = os.path.basename(pdf_path)
+                for outcome in outcomes:
+                    # Batched tasks report one (path, result, error) tuple per resume
+                    for pdf_path, result, error in _with_duplicates(outcome if isinstance(outcome, list) else [outcome],
+                                                                    duplicates):
+                        completed += 1
+                        filename = os.path.basename(pdf_path)
                     
-                    # Update progress bar
-                    pbar.set_postfix_str(f"Latest: {filename[:25]}...")
+                        # Update progress bar
+                        pbar.set_postfix_str(f"Latest: {filename[:25]}...")
                     
-                    if result:
-                        results.append(result)
-                        success_count += 1
-                        pbar.set_description(f"📄 Processing resumes (✅ {success_count} successful)")
-                    else:
-                        # Track failed resumes
-                        error_reason = error or 'LLM parsing failed - check resume format and content'
-                        errors.append({
-                            'resume_filename': filename,
-                            'pdf_path': pdf_path,
-                            'error_time': time.strftime('%Y-%m-%d %H:%M:%S'),
-                            'error_reason': error_reason
-                        })
-                        pbar.set_description(f"📄 Processing resumes (⚠️ {len(errors)} failed)")
+                        if result:
+                            write_q.put(('row', result))
+                            success_count += 1
+                            pbar.set_description(f"📄 Processing resumes (✅ {success_count} successful)")
+                        else:
+                            # Track failed resumes
+                            error_reason = error or 'LLM parsing failed - check resume format and content'
+                            errors.append({
+                                'resume_filename': filename,
+                                'pdf_path': pdf_path,
+                                'error_time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                                'error_reason': error_reason
+                            })
+                            pbar.set_description(f"📄 Processing resumes (⚠️ {len(errors)} failed)")
                     
-                    pbar.update(1)
+                        pbar.update(1)
                     
-                    # Save intermediate results every 20 completed resumes
-                    if completed % 20 == 0:
-                        try:
-                            self._save_results(results, f"{output_file}.tmp")
-                            self._save_errors(errors, f"{output_file.replace('.csv', '_errors.csv')}")
-                            processed_count = len([r for r in results if isinstance(r, dict)])
-                            pbar.write(f"💾 Saved intermediate results ({processed_count} total processed)")
-                        except Exception as e:
-                            pbar.write(f"⚠️ Warning: Failed to save intermediate results: {e}")
+                        # Save the error report every 20 completed resumes
+                        if completed % 20 == 0 and errors:
+                            write_q.put(('errors', list(errors)))
                             
         except KeyboardInterrupt:
             pbar.write(f"\n🛑 Processing interrupted by user. Saving progress...")
             pbar.close()
-            # Save what we have so far
-            if results:
-                self._save_results(results, f"{output_file}.interrupted")
-                pbar.write(f"💾 Partial results saved to {output_file}.interrupted")
+            write_q.put(('errors', list(errors)))
+            pbar.write(f"💾 Results so far are saved in {output_file}")
             sys.exit(1)
         finally:
             pbar.close()
+            # Let the writer drain everything queued so far before reporting
+            write_q.put(None)
+            writer_thread.join()
         
-        # Save final results with better feedback
-        if results:
-            self._save_results(results, output_file)
-            successful_count = len([r for r in results if isinstance(r, dict) and 'resume_filename' in r])
+        # Summarize the results with better feedback
+        # Rows only live in the output file, so count them instead of keeping them
+        if success_count or already_processed:
+            successful_count = len(already_processed) + success_count
             
             print(f"\n🎉 Processing Complete!")
             print(f"✅ Successfully processed: {successful_count} resumes")
             print(f"📁 Results saved to: {output_file}")
-            
-            # Clean up temp file
-            temp_file = f"{output_file}.tmp"
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-                print(f"🧹 Cleaned up temporary file: {temp_file}")
         else:
             print(f"\n❌ No resumes were successfully processed!")
             print(f"💡 Troubleshooting tips:")
@@ -716,7 +1374,6 @@ Return clean JSON without any extra tags or text."""
         
         # Save error report with helpful feedback
         if errors:
-            error_file = output_file.replace('.csv', '_errors.csv')
             self._save_errors(errors, error_file)
             error_count = len(errors)
             
@@ -726,7 +1383,7 @@ Return clean JSON without any extra tags or text."""
             if error_count > 0:
                 print(f"\n💡 Common solutions:")
                 print(f"   • PDF extraction failed: Try different resume files or check file corruption")
-                print(f"   • Rate limits: The script includes delays, but you may need longer pauses")
+                print(f"   • Rate limits: Lower --rpm/--tpm to match your provider's limits")
                 print(f"   • API errors: Check your API key and account limits")
                 print(f"   • Parsing errors: Some resumes may have unusual formatting")
         
@@ -739,39 +1396,73 @@ Return clean JSON without any extra tags or text."""
             print(f"   ✅ Successful: {success_count}")
             print(f"   ❌ Failed: {len(errors)}")
             print(f"   📈 Success rate: {success_rate:.1f}%")
+            if self.cache:
+                print(f"   🗄️ Cache: {self.cache_stats['hits']} hits, {self.cache_stats['misses']} misses")
     
-    def _save_results(self, results: List[Dict], output_file: str):
-        """Save results to CSV file."""
-        if not results:
+    def _writer_loop(self, write_q: queue.Queue, csvfile, writer: csv.DictWriter, error_file: str):
+        """Write queued ('row', result) and ('errors', errors) items until a None sentinel arrives."""
+        try:
+            while True:
+                item = write_q.get()
+                if item is None:
+                    return
+                kind, payload = item
+                try:
+                    if kind == 'row':
+                        writer.writerow(_csv_row(payload))
+                        csvfile.flush()
+                        os.fsync(csvfile.fileno())
+                    else:
+                        self._save_errors(payload, error_file)
+                except Exception as e:
+                    logging.error(f"⚠️ Failed to write {'result row' if kind == 'row' else 'error report'}: {e}")
+        finally:
+            csvfile.close()
+    
+    def _open_results_csv(self, output_file: str):
+        """Open the results CSV for appending, writing the header if the file is new.
+        
+        An existing file whose header differs from RESUME_FIELDNAMES is rewritten under
+        the current columns first (see _migrate_results_csv), so appended rows always
+        line up with the header. Returns (file, writer); the caller closes the file.
+        """
+        self._migrate_results_csv(output_file)
+        csvfile = open(output_file, 'a', newline='', encoding='utf-8')
+        writer = csv.DictWriter(csvfile, fieldnames=RESUME_FIELDNAMES)
+        if csvfile.tell() == 0:
+            writer.writeheader()
+        return csvfile, writer
+
+    def _migrate_results_csv(self, output_file: str):
+        """Rewrite an existing results CSV under RESUME_FIELDNAMES if its header differs.
+        
+        Columns added since the file was written are left blank for its rows. A file with
+        columns the current schema does not have is rejected with a ValueError instead,
+        since rewriting it would drop them.
+        """
+        try:
+            with open(output_file, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                header = reader.fieldnames
+                if not header or tuple(header) == RESUME_FIELDNAMES:
+                    return
+                unknown = [name for name in header if name not in RESUME_FIELDNAMES]
+                if unknown:
+                    raise ValueError(
+                        f"❌ {output_file} has columns the current schema does not: {', '.join(unknown[:5])}\n"
+                        f"💡 Use a different --output file, or remove those columns from it first"
+                    )
+                rows = list(reader)
+        except FileNotFoundError:
             return
-            
-        fieldnames = [
-            'resume_filename', 'candidate_name', 'email', 'github_link', 'linkedin_link', 
-            'country', 'city', 'estimated_job_level', 'programming_experience_years', 'ai_experience_years',
-            'college_education_years', 'highest_degree', 'bachelors_university', 'graduate_university',
-            'university_tier', 'overall_world_ranking', 'cs_world_ranking', 'bachelors_gpa', 'masters_gpa',
-            'companies_worked', 'company_tier', 
-            'javascript_skill_level', 'python_skill_level', 'cloud_skill_level', 'llm_skill_level',
-            'cs_internships', 'cloud_experience_years', 'llm_experience_years',
-            # Frontend Stack
-            'react_strength', 'typescript_strength', 'nextjs_strength', 'api_design_strength',
-            'tailwind_strength', 'git_strength', 'agile_strength',
-            'aws_services_experience', 'database_technologies', 'ai_tools_experience', 'llm_api_experience',
-            # Work style
-            'startup_experience_strength', 'open_source_strength', 'leadership_strength', 'autonomy_indicators',
-            # CS fundamentals
-            'algorithms_strength', 'system_design_strength',
-            # Age-Relative Aggregate Scores
-            'academic_strength', 'cs_strength', 'industry_strength', 'fullstack_strength',
-            'opensource_strength', 'accomplishments_strength', 'overall_score',
-            # Accomplishments
-            'accomplishment_1', 'accomplishment_2', 'accomplishment_3'
-        ]
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        
+        logging.info(f"Rewriting {output_file} under the current columns ({len(rows)} existing rows)")
+        temp_file = f"{output_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RESUME_FIELDNAMES)
             writer.writeheader()
-            writer.writerows(results)
+            writer.writerows(rows)
+        os.replace(temp_file, output_file)
 
     def _save_errors(self, errors: List[Dict], error_file: str):
         """Save error report to CSV file."""
@@ -818,8 +1509,20 @@ Set API keys via environment variables:
     parser.add_argument('--sample', type=int, help='Process only N resumes for testing (default: all)')
     parser.add_argument('--directory', default='.', help='Directory to search for resumes (default: current)')
     parser.add_argument('--workers', type=int, default=4, help='Number of parallel workers (default: 4, max recommended: 8)')
+    parser.add_argument('--rpm', type=float, default=120, help='Maximum LLM requests per minute across all workers (default: 120)')
+    parser.add_argument('--tpm', type=float, help='Maximum LLM tokens per minute across all workers (default: unlimited)')
+    parser.add_argument('--resumes-per-call', type=int, default=1,
+                       help='Pack up to N resumes into each LLM request, limited by the model context window (default: 1)')
+    parser.add_argument('--max-resume-tokens', type=int, default=RESUME_TEXT_TOKENS,
+                       help=f'Resume text tokens sent per request; longer resumes are truncated (default: {RESUME_TEXT_TOKENS})')
+    parser.add_argument('--batch-api', action='store_true',
+                       help='Submit all resumes as one OpenAI Batch API job: half the price, results within 24h (openai only)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help=f'Directory for cached PDF text and LLM results (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the PDF text and LLM result cache')
     
     args = parser.parse_args()
+    if args.resumes_per_call < 1:
+        parser.error("--resumes-per-call must be at least 1")
     
     print(f"🚀 Starting resume extraction with {args.provider}/{args.model}")
     print(f"📂 Searching directory: {args.directory}")
@@ -831,7 +1534,11 @@ Set API keys via environment variables:
     
     try:
         # Initialize parser
-        resume_parser = ResumeLLMParser(provider=args.provider, model=args.model, api_key=args.api_key, max_workers=args.workers)
+        resume_parser = ResumeLLMParser(provider=args.provider, model=args.model, api_key=args.api_key, max_workers=args.workers,
+                                        requests_per_minute=args.rpm, tokens_per_minute=args.tpm,
+                                        cache_dir=None if args.no_cache else args.cache_dir,
+                                        resumes_per_call=args.resumes_per_call, batch_api=args.batch_api,
+                                        max_resume_tokens=args.max_resume_tokens)
         print(f"✅ Successfully initialized {args.provider}/{args.model} client with {args.workers} workers")
         
         # Process resumes
@@ -11,13 +11,19 @@ See LICENSE file for full license text.
 """
 
 import http.server
-import socketserver
 import os
 import sys
 import json
 import argparse
 from pathlib import Path
 
+try:
+    import orjson  # optional, much faster for large resume trees
+except ImportError:
+    orjson = None
+
+from pdf_files import walk_pdfs
+
 def find_resume_paths(search_dirs=None):
     """Find all resume files and their paths."""
     resume_paths = {}
@@ -33,15 +39,17 @@ def find_resume_paths(search_dirs=None):
     
     for subdir in subdirs:
         # Look for PDF files
-        for file_path in subdir.rglob('*.pdf'):
-            filename = file_path.name
-            resume_paths[filename] = str(file_path.relative_to(current_dir))
+        for file_path in walk_pdfs(subdir):
+            resume_paths[os.path.basename(file_path)] = os.path.relpath(file_path, current_dir)
     
     print(f"📄 Found {len(resume_paths)} resume files")
     
     # Save to JSON file
-    with open('resume_paths.json', 'w') as f:
-        json.dump(resume_paths, f, indent=2)
+    if orjson is not None:
+        Path('resume_paths.json').write_bytes(orjson.dumps(resume_paths, option=orjson.OPT_INDENT_2))
+    else:
+        with open('resume_paths.json', 'w') as f:
+            json.dump(resume_paths, f, indent=2)
     
     print("💾 Resume paths saved to resume_paths.json")
     return resume_paths
@@ -96,9 +104,17 @@ def main():
         def do_OPTIONS(self):
             self.send_response(200)
             self.end_headers()
+        
+        def copyfile(self, source, outputfile):
+            # socket.sendfile uses os.sendfile for real files, so PDFs go from the page
+            # cache to the socket without passing through Python; in-memory bodies such
+            # as directory listings fall back to a plain send
+            outputfile.flush()
+            self.connection.sendfile(source)
     
     try:
-        with socketserver.TCPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
+        # One thread per connection, so a slow PDF download does not block other requests
+        with http.server.ThreadingHTTPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
             print(f"🚀 Recruiting Dashboard server starting...")
             print(f"📊 Dashboard available at: http://localhost:{PORT}/recruiting_dashboard.html?csv={args.csv_file}")
             print(f"📁 Serving files from: {script_dir}")
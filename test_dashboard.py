@@ -12,9 +12,17 @@ See LICENSE file for full license text.
 """
 
 import csv
+import heapq
 import json
 import argparse
 from pathlib import Path
+from pdf_files import walk_pdfs
+
+# Columns the dashboard cannot work without
+REQUIRED_COLUMNS = frozenset({
+    'candidate_name', 'email', 'overall_score', 'bachelors_university',
+    'github_link', 'linkedin_link', 'estimated_job_level'
+})
 
 def test_csv_parsing(csv_filename='candidates.csv'):
     """Test that the CSV file can be parsed correctly."""
@@ -32,15 +40,7 @@ def test_csv_parsing(csv_filename='candidates.csv'):
         print(f"✅ Successfully parsed {len(rows)} candidate records")
         
         # Check required columns
-        required_columns = [
-            'candidate_name', 'email', 'overall_score', 'bachelors_university',
-            'github_link', 'linkedin_link', 'estimated_job_level'
-        ]
-        
-        missing_columns = []
-        for col in required_columns:
-            if col not in reader.fieldnames:
-                missing_columns.append(col)
+        missing_columns = sorted(REQUIRED_COLUMNS - set(reader.fieldnames or ()))
         
         if missing_columns:
             print(f"❌ Missing required columns: {missing_columns}")
@@ -48,18 +48,20 @@ def test_csv_parsing(csv_filename='candidates.csv'):
         
         print("✅ All required columns present")
         
-        # Check data quality
+        # Check data quality, parsing each score once for both the count and the ranking
         valid_scores = 0
         valid_emails = 0
         valid_names = 0
+        scores = []
         
         for row in rows:
             try:
                 score = float(row.get('overall_score', 0))
-                if score > 0:
-                    valid_scores += 1
             except (ValueError, TypeError):
-                pass
+                score = 0.0
+            scores.append(score)
+            if score > 0:
+                valid_scores += 1
             
             if row.get('email', '').strip():
                 valid_emails += 1
@@ -72,10 +74,10 @@ def test_csv_parsing(csv_filename='candidates.csv'):
         print(f"   - Valid emails: {valid_emails}/{len(rows)}")
         print(f"   - Valid names: {valid_names}/{len(rows)}")
         
-        # Show top 5 candidates
-        sorted_rows = sorted(rows, key=lambda x: float(x.get('overall_score', 0)), reverse=True)
+        # Show top 5 candidates; a partial heap select instead of sorting every row
+        top_indices = heapq.nlargest(5, range(len(rows)), key=scores.__getitem__)
         print(f"\n🏆 Top 5 candidates by score:")
-        for i, row in enumerate(sorted_rows[:5], 1):
+        for i, row in enumerate((rows[index] for index in top_indices), 1):
             name = row.get('candidate_name', 'Unknown')
             score = row.get('overall_score', '0')
             university = row.get('bachelors_university', row.get('graduate_university', 'Unknown'))
@@ -158,8 +160,7 @@ def test_resume_directories():
     
     total_resumes = 0
     for subdir in subdirs[:5]:  # Show first 5 directories
-        pdf_files = list(subdir.rglob('*.pdf'))
-        dir_total = len(pdf_files)
+        dir_total = sum(1 for _ in walk_pdfs(subdir))
         total_resumes += dir_total
         
         if dir_total > 0:
@@ -168,8 +169,7 @@ def test_resume_directories():
     if len(subdirs) > 5:
         # Count remaining directories
         for subdir in subdirs[5:]:
-            pdf_files = list(subdir.rglob('*.pdf'))
-            total_resumes += len(pdf_files)
+            total_resumes += sum(1 for _ in walk_pdfs(subdir))
         
         print(f"   ... and {len(subdirs) - 5} more directories")
     